@@ -1,3 +1,4 @@
+import time
 from typing import Any, Optional
 
 from ..IRegistry import IRegistry
@@ -5,10 +6,15 @@ from ..RegistryTypes import RegistryData, RegistryQuery
 
 
 class DynamoRegistry(IRegistry):
+    __dynamodb: Any
     __table: Any
+    __batch_get_limit = 100
+    __batch_get_attempts = 5
+    __retry_delay = 0.05
 
-    def __init__(self, table: Any) -> None:
+    def __init__(self, dynamodb: Any, table: Any) -> None:
         super().__init__()
+        self.__dynamodb = dynamodb
         self.__table = table
 
     def create(self, id: str, data: RegistryData) -> None:
@@ -17,15 +23,36 @@ class DynamoRegistry(IRegistry):
         data["id"] = id
         self.__table.put_item(Item=data)
 
+    def create_many(self, items: dict[str, RegistryData]) -> None:
+        if any("id" in data for data in items.values()):
+            raise AttributeError("Key 'id' can not be in data attribute")
+        with self.__table.batch_writer() as batch:
+            for id, data in items.items():
+                batch.put_item(Item={**data, "id": id})
+
     def read(self, query: RegistryQuery) -> list[RegistryData]:
+        response = self.__table.scan(ScanFilter=self.__scan_filter(query))
+        return response["Items"]
+
+    def read_projection(
+        self, query: RegistryQuery, fields: set[str]
+    ) -> list[RegistryData]:
         response = self.__table.scan(
-            ScanFilter={
-                key: {"AttributeValueList": [value], "ComparisonOperator": "EQ"}
-                for key, value in query.items()
-            }
+            ScanFilter=self.__scan_filter(query), AttributesToGet=sorted(fields)
         )
         return response["Items"]
 
+    def count(self, query: RegistryQuery) -> int:
+        scan_arguments = {"ScanFilter": self.__scan_filter(query), "Select": "COUNT"}
+        response = self.__table.scan(**scan_arguments)
+        count: int = response["Count"]
+        while "LastEvaluatedKey" in response:
+            response = self.__table.scan(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **scan_arguments
+            )
+            count += response["Count"]
+        return count
+
     def update(self, id: str, data: RegistryData) -> bool:
         if "id" in data:
             raise AttributeError("Key 'id' can not be in data attribute")
@@ -45,7 +72,55 @@ class DynamoRegistry(IRegistry):
         )
         return "id" in response["Attributes"]
 
+    def delete_many(self, ids: list[str]) -> None:
+        with self.__table.batch_writer() as batch:
+            for id in dict.fromkeys(ids):
+                batch.delete_item(Key={"id": id})
+
     def get(self, id: str) -> Optional[RegistryData]:
         response: dict[str, Any] = self.__table.get_item(Key={"id": id})
         # raise ValueError(response)
         return response.get("Item", None)
+
+    def batch_get(self, ids: list[str]) -> dict[str, RegistryData]:
+        result: dict[str, RegistryData] = {}
+        keys = [{"id": id} for id in dict.fromkeys(ids)]
+        limit = self.__batch_get_limit
+        while keys:
+            chunk, keys = keys[:limit], keys[limit:]
+            request: dict[str, Any] = {self.__table.name: {"Keys": chunk}}
+            for attempt in range(self.__batch_get_attempts):
+                if attempt > 0:
+                    # keys are left unprocessed when the table is throttled,
+                    # back off exponentially before asking for them again
+                    time.sleep(self.__retry_delay * 2 ** (attempt - 1))
+                response = self.__dynamodb.batch_get_item(RequestItems=request)
+                for item in response["Responses"].get(self.__table.name, []):
+                    result[item["id"]] = item
+                request = response.get("UnprocessedKeys")
+                if not request:
+                    break
+            else:
+                raise TimeoutError("Keys are still unprocessed after retries")
+        return result
+
+    def exists(self, id: str) -> bool:
+        return self.get_projection(id, set()) is not None
+
+    def get_projection(self, id: str, fields: set[str]) -> Optional[RegistryData]:
+        names = {
+            f"#field{index}": field
+            for index, field in enumerate(sorted(fields | {"id"}))
+        }
+        response: dict[str, Any] = self.__table.get_item(
+            Key={"id": id},
+            ProjectionExpression=", ".join(names),
+            ExpressionAttributeNames=names,
+        )
+        return response.get("Item", None)
+
+    def __scan_filter(self, query: RegistryQuery) -> dict[str, Any]:
+        return {
+            key: {"AttributeValueList": [value], "ComparisonOperator": "EQ"}
+            for key, value in query.items()
+        }
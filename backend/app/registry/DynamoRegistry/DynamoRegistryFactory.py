@@ -22,7 +22,7 @@ class DynamoRegistryFactory(IRegistryFactory):
 
     def get(self, name: str) -> IRegistry:
         self.__create_table(name)
-        return DynamoRegistry(self.__dynamodb.Table(name))
+        return DynamoRegistry(self.__dynamodb, self.__dynamodb.Table(name))
 
     def __create_table(self, name: str) -> None:
         if name in self.__get_table_names():
@@ -12,10 +12,24 @@ class IRegistry(ABC):
     def create(self, id: str, data: RegistryData) -> None:
         pass
 
+    @abstractmethod
+    def create_many(self, items: dict[str, RegistryData]) -> None:
+        pass
+
     @abstractmethod
     def read(self, query: RegistryQuery) -> list[RegistryData]:
         pass
 
+    @abstractmethod
+    def read_projection(
+        self, query: RegistryQuery, fields: set[str]
+    ) -> list[RegistryData]:
+        pass
+
+    @abstractmethod
+    def count(self, query: RegistryQuery) -> int:
+        pass
+
     @abstractmethod
     def update(self, id: str, data: RegistryData) -> bool:
         pass
@@ -24,6 +38,22 @@ class IRegistry(ABC):
     def delete(self, id: str) -> bool:
         pass
 
+    @abstractmethod
+    def delete_many(self, ids: list[str]) -> None:
+        pass
+
     @abstractmethod
     def get(self, id: str) -> Optional[RegistryData]:
         pass
+
+    @abstractmethod
+    def batch_get(self, ids: list[str]) -> dict[str, RegistryData]:
+        pass
+
+    @abstractmethod
+    def exists(self, id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_projection(self, id: str, fields: set[str]) -> Optional[RegistryData]:
+        pass
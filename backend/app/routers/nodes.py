@@ -1,16 +1,20 @@
-from typing import Annotated
+from typing import Annotated, AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from app.services import NodeService
 from app.services.exceptions import (
     EndNodeError,
+    NodeAttributeNotFoundError,
     NodeCannotBeDeletedError,
     NodeInDifferentTreeError,
     NodeNotFoundError,
     NotAllowedError,
     TemplateDoesNotExistError,
     UserNotFoundError,
+    WrongInitiatorError,
 )
 from app.services.NodeService.schemas.NodeCreateSchema import NodeCreateSchema
 from app.services.NodeService.schemas.NodeExtendedSchema import NodeExtendedSchema
@@ -24,6 +28,32 @@ from .exceptions import HTTPExceptionSchema
 
 router = APIRouter(prefix="/nodes", tags=["Nodes"])
 
+tree_level_adapter: TypeAdapter[list[NodeExtendedSchema]] = TypeAdapter(
+    list[NodeExtendedSchema]
+)
+
+
+async def dump_tree_levels(
+    levels: AsyncIterator[list[NodeExtendedSchema]],
+) -> AsyncIterator[bytes]:
+    """
+    Serialize tree levels as ndjson lines. Headers are already sent when deeper \
+    levels are read, so a failure ends the stream with an error line instead
+
+    Args:
+        levels (AsyncIterator[list[NodeExtendedSchema]]): levels of a tree
+
+    Returns:
+        AsyncIterator[bytes]: one JSON array per level, or HTTPExceptionSchema \
+            as the last line if the tree could not be read to the end
+    """
+    try:
+        async for level in levels:
+            yield tree_level_adapter.dump_json(level) + b"\n"
+    except (NodeNotFoundError, NodeAttributeNotFoundError):
+        error = HTTPExceptionSchema(detail="The tree was changed while being read")
+        yield error.model_dump_json().encode() + b"\n"
+
 
 @router.get(
     "/{node_id}",
@@ -82,6 +112,46 @@ async def node_get_tree(
         raise HTTPException(status.HTTP_403_FORBIDDEN, "You cant get this tree")
 
 
+@router.get(
+    "/tree/{node_id}/levels",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "One JSON array of nodes per tree level, "
+            "separated by new lines. If the tree is changed while being read, "
+            "the last line is an error object instead",
+            "content": {"application/x-ndjson": {}},
+        },
+        status.HTTP_401_UNAUTHORIZED: {"model": HTTPExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": HTTPExceptionSchema},
+        status.HTTP_404_NOT_FOUND: {"model": HTTPExceptionSchema},
+    },
+)
+async def node_get_tree_levels(
+    initiator_id: Annotated[UserId, Depends(get_user_id_by_init_data)],
+    node_service: Annotated[NodeService, Depends(get_node_service)],
+    node_id: NodeId,
+) -> StreamingResponse:
+    try:
+        levels = await node_service.try_iter_tree(initiator_id, node_id)
+    except WrongInitiatorError:
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Wrong initiator")
+    except UserNotFoundError:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND, "A user with this ID does not exist"
+        )
+    except NodeNotFoundError:
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND, "A node with this id does not exist"
+        )
+    except NotAllowedError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "You cant get this tree")
+    return StreamingResponse(
+        dump_tree_levels(levels),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.post(
     "/",
     status_code=status.HTTP_201_CREATED,
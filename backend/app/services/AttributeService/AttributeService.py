@@ -1,4 +1,5 @@
 import re
+from typing import Any, cast
 
 from app.registry import IRegistry
 
@@ -25,6 +26,7 @@ class AttributeService(IAttributeService):
     __type_registry: IRegistry
     __attribute_registry: IRegistry
     __file_service: IFileService
+    __types: dict[AttributeTypeId, AttributeTypeSchema]
     __file_based_attribute_types = ["image", "container"]
 
     def __init__(self, type_registry: IRegistry, attribute_service: IRegistry) -> None:
@@ -37,6 +39,7 @@ class AttributeService(IAttributeService):
         """
         self.__type_registry = type_registry
         self.__attribute_registry = attribute_service
+        self.__types = {}
 
     async def inject_dependencies(self, file_service: IFileService) -> None:
         """
@@ -58,10 +61,13 @@ class AttributeService(IAttributeService):
         Returns:
             AttributeTypeSchema: Pydantic schema representation of attribute type
         """
+        if attribute_type in self.__types:
+            return self.__types[attribute_type]
         result = self.__type_registry.get(attribute_type)
         if result is None:
             raise AttributeTypeNotFoundError()
-        return AttributeTypeSchema(**result)
+        self.__types[attribute_type] = AttributeTypeSchema(**result)
+        return self.__types[attribute_type]
 
     async def get_all_types(self) -> list[AttributeTypeSchema]:
         """
@@ -94,6 +100,67 @@ class AttributeService(IAttributeService):
             raise NodeAttributeNotFoundError()
         return NodeAttributeExternalSchema(**result)
 
+    async def get_types_bulk(
+        self, attribute_types: list[AttributeTypeId]
+    ) -> dict[AttributeTypeId, AttributeTypeSchema]:
+        """
+        returns information about several types of attributes at once
+
+        Args:
+            attribute_types (list[AttributeTypeId]): ids of types of attributes
+
+        Raises:
+            AttributeTypeNotFoundError: raised when some type with given id does not \
+            exist
+
+        Returns:
+            dict[AttributeTypeId, AttributeTypeSchema]: Pydantic schema \
+            representations of attribute types by their ids
+        """
+        missing_types = [
+            attribute_type
+            for attribute_type in set(attribute_types)
+            if attribute_type not in self.__types
+        ]
+        if len(missing_types) > 0:
+            results = self.__type_registry.batch_get(list(missing_types))
+            if len(results) != len(missing_types):
+                raise AttributeTypeNotFoundError()
+            for id, result in results.items():
+                self.__types[AttributeTypeId(id)] = AttributeTypeSchema(**result)
+        return {
+            attribute_type: self.__types[attribute_type]
+            for attribute_type in attribute_types
+        }
+
+    async def get_attributes_bulk(
+        self, attribute_ids: list[NodeId]
+    ) -> dict[NodeId, NodeAttributeExternalSchema]:
+        """
+        returns several node-attributes at once
+
+        Args:
+            attribute_ids (list[NodeId]): ids of node-attributes
+
+        Raises:
+            NodeAttributeNotFoundError: raised when some node-attribute with given id \
+            does not exist
+
+        Returns:
+            dict[NodeId, NodeAttributeExternalSchema]: Pydantic schema \
+            representations of node-attributes by their ids
+        """
+        results = self.__attribute_registry.batch_get(list(attribute_ids))
+        if len(results) != len(set(attribute_ids)):
+            raise NodeAttributeNotFoundError()
+        # records are written by this service only, so they are not validated again
+        return {
+            NodeId(id): NodeAttributeExternalSchema.model_construct(
+                **cast(dict[str, Any], result)
+            )
+            for id, result in results.items()
+        }
+
     async def create_type(self, new_type: AttributeTypeSchema) -> None:
         """
         creates new attribute type
@@ -136,6 +203,34 @@ class AttributeService(IAttributeService):
             await self.__validate_attribute(key, value, node_type)
         self.__attribute_registry.create(id, new_node_attribute.model_dump())
 
+    async def create_attributes_bulk(
+        self, new_node_attributes: dict[NodeId, NodeAttributeExternalSchema]
+    ) -> None:
+        """
+        create several node-attributes at once
+
+        Args:
+            new_node_attributes (dict[NodeId, NodeAttributeExternalSchema]): data \
+            required to create new node-attributes by ids of their nodes
+
+        Raises:
+            AttributeTypeNotFoundError: raised when attribute type of some new \
+            node-attribute is invalid
+        """
+        node_types = await self.get_types_bulk(
+            list({attribute.type_id for attribute in new_node_attributes.values()})
+        )
+        for new_node_attribute in new_node_attributes.values():
+            node_type = node_types[new_node_attribute.type_id]
+            for key, value in new_node_attribute.attrs.items():
+                await self.__validate_attribute(key, value, node_type)
+        self.__attribute_registry.create_many(
+            {
+                id: new_node_attribute.model_dump()
+                for id, new_node_attribute in new_node_attributes.items()
+            }
+        )
+
     async def delete_attribute(self, attribute_id: NodeId) -> None:
         """
         deletes node-attribute
@@ -153,6 +248,20 @@ class AttributeService(IAttributeService):
             await self.__file_service.remove_file(attribute_id)
         self.__attribute_registry.delete(attribute_id)
 
+    async def delete_attributes_bulk(self, attribute_ids: list[NodeId]) -> None:
+        """
+        deletes several node-attributes at once, missing ones are skipped
+
+        Args:
+            attribute_ids (list[NodeId]): ids of node-attributes
+        """
+        attributes = self.__attribute_registry.batch_get(list(attribute_ids))
+        for attribute_id, attribute in attributes.items():
+            is_file_type = attribute["type_id"] in self.__file_based_attribute_types
+            if is_file_type and await self.__file_service.exists(attribute_id):
+                await self.__file_service.remove_file(attribute_id)
+        self.__attribute_registry.delete_many(list(attributes))
+
     async def delete_type(self, attribute_id: AttributeTypeId) -> None:
         """
         delets attribute type
@@ -164,6 +273,7 @@ class AttributeService(IAttributeService):
             AttributeTypeNotFoundError: raised when attribute type with given id does \
             not exit
         """
+        self.__types.pop(attribute_id, None)
         if not self.__type_registry.delete(attribute_id):
             raise AttributeTypeNotFoundError()
 
@@ -201,8 +311,7 @@ class AttributeService(IAttributeService):
         Returns:
             bool: returns true if exists and false when doesn't
         """
-        attr_type = self.__type_registry.get(attribute_id)
-        return attr_type is not None
+        return self.__type_registry.exists(attribute_id)
 
     async def is_file_type(self, node_id: NodeId) -> bool:
         """
@@ -19,6 +19,18 @@ class IAttributeService(ABC):
     async def get_attribute(self, attribute_id: NodeId) -> NodeAttributeExternalSchema:
         pass
 
+    @abstractmethod
+    async def get_types_bulk(
+        self, attribute_types: list[AttributeTypeId]
+    ) -> dict[AttributeTypeId, AttributeTypeSchema]:
+        pass
+
+    @abstractmethod
+    async def get_attributes_bulk(
+        self, attribute_ids: list[NodeId]
+    ) -> dict[NodeId, NodeAttributeExternalSchema]:
+        pass
+
     @abstractmethod
     async def create_type(self, new_type: AttributeTypeSchema) -> None:
         pass
@@ -29,6 +41,12 @@ class IAttributeService(ABC):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def create_attributes_bulk(
+        self, new_node_attributes: dict[NodeId, NodeAttributeExternalSchema]
+    ) -> None:
+        pass
+
     @abstractmethod
     async def delete_type(self, attribute_type: AttributeTypeId) -> None:
         pass
@@ -37,6 +55,10 @@ class IAttributeService(ABC):
     async def delete_attribute(self, attribute_id: NodeId) -> None:
         pass
 
+    @abstractmethod
+    async def delete_attributes_bulk(self, attribute_ids: list[NodeId]) -> None:
+        pass
+
     @abstractmethod
     async def update_node_attributes(
         self, node_id: NodeId, key: str, value: str
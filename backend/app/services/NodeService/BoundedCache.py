@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class BoundedCache(Generic[KeyT, ValueT]):
+    """
+    In-memory cache that keeps only the most recently used entries
+    """
+
+    __entries: OrderedDict[KeyT, ValueT]
+    __size: int
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialize an empty cache
+
+        Args:
+            size (int): maximum number of entries, the least recently used \
+                entry is dropped when it is exceeded
+        """
+        self.__entries = OrderedDict()
+        self.__size = size
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """
+        get cached value and mark it as recently used
+
+        Args:
+            key (KeyT): key of an entry
+
+        Returns:
+            Optional[ValueT]: cached value or None if there is no such entry
+        """
+        value = self.__entries.get(key)
+        if value is not None:
+            self.__entries.move_to_end(key)
+        return value
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """
+        cache value, dropping the least recently used entry if the cache is full
+
+        Args:
+            key (KeyT): key of an entry
+            value (ValueT): value to cache
+        """
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__size:
+            self.__entries.popitem(last=False)
+
+    def pop(self, key: KeyT) -> None:
+        """
+        drop entry if it is cached
+
+        Args:
+            key (KeyT): key of an entry
+        """
+        self.__entries.pop(key, None)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 from ..AttributeService.schemas.NodeAttributeExternalSchema import (
     NodeAttributeExternalSchema,
@@ -30,6 +31,12 @@ class INodeService(ABC):
     ) -> NodeTreeSchema:
         pass
 
+    @abstractmethod
+    async def try_iter_tree(
+        self, initiator_id: UserId, node_id: NodeId
+    ) -> AsyncIterator[list[NodeExtendedSchema]]:
+        pass
+
     @abstractmethod
     async def try_delete(self, initiator_id: UserId, node_id: NodeId) -> None:
         pass
@@ -46,6 +53,14 @@ class INodeService(ABC):
     ) -> NodeId:
         pass
 
+    @abstractmethod
+    async def create_bulk(
+        self,
+        nodes: list[tuple[int | None, NodeAttributeExternalSchema]],
+        parent_id: NodeId | None = None,
+    ) -> list[NodeId]:
+        pass
+
     @abstractmethod
     async def exist(self, node_id: NodeId) -> bool:
         pass
@@ -54,6 +69,12 @@ class INodeService(ABC):
     async def get_tree(self, node_id: NodeId) -> NodeTreeSchema:
         pass
 
+    @abstractmethod
+    async def iter_tree(
+        self, node_id: NodeId
+    ) -> AsyncIterator[list[NodeExtendedSchema]]:
+        pass
+
     @abstractmethod
     async def delete(self, node_id: NodeId) -> None:
         pass
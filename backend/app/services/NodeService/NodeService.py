@@ -1,4 +1,7 @@
+from typing import Any, AsyncIterator, cast
+
 from app.registry import IRegistry
+from app.registry.RegistryTypes import RegistryData
 
 from ..AttributeService import IAttributeService
 from ..AttributeService.schemas.NodeAttributeExternalSchema import (
@@ -7,6 +10,7 @@ from ..AttributeService.schemas.NodeAttributeExternalSchema import (
 from ..exceptions import (
     EndNodeError,
     IncompatibleNodeError,
+    NodeAttributeNotFoundError,
     NodeCannotBeDeletedError,
     NodeInDifferentTreeError,
     NodeNotFoundError,
@@ -16,6 +20,7 @@ from ..ProjectService.IProjectService import IProjectService
 from ..TemplateService.ITemplateService import ITemplateService
 from ..UserService.IUserService import IUserService
 from ..UserService.schemas.UserId import UserId
+from .BoundedCache import BoundedCache
 from .INodeService import INodeService
 from .schemas.NodeCreateSchema import NodeCreateSchema
 from .schemas.NodeExtendedSchema import NodeExtendedSchema
@@ -35,6 +40,10 @@ class NodeService(INodeService):
     __project_service: IProjectService
     __attribute_service: IAttributeService
     __template_service: ITemplateService
+    __root_node_ids: BoundedCache[NodeId, NodeId]
+    __owner_ids: BoundedCache[NodeId, UserId]
+    __root_node_ids_cache_size = 10000
+    __owner_ids_cache_size = 1000
 
     def __init__(
         self,
@@ -47,6 +56,8 @@ class NodeService(INodeService):
             registry (IRegistry): the registry used for node operations
         """
         self.__registry = registry
+        self.__root_node_ids = BoundedCache(self.__root_node_ids_cache_size)
+        self.__owner_ids = BoundedCache(self.__owner_ids_cache_size)
 
     async def inject_dependencies(
         self,
@@ -86,8 +97,6 @@ class NodeService(INodeService):
             NotAllowedError: raised when operation is performed by user who does not \
             own the project node belongs to
             NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
         """
 
         await self.__user_service.user_exist_validation(initiator_id)
@@ -112,8 +121,6 @@ class NodeService(INodeService):
             NotAllowedError: raised when user tries to update node from project \
             they do not own
             NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
             NodeInDifferentTreeError: raised when trying reparent node to different tree
         """
         await self.__user_service.user_exist_validation(initiator_id)
@@ -144,8 +151,6 @@ class NodeService(INodeService):
             NotAllowedError: raised when user tries to update node from project \
                 they do not own
             NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
         """
         await self.__user_service.user_exist_validation(initiator_id)
         await self.__check_initiator_permission(initiator_id, node_id)
@@ -153,6 +158,31 @@ class NodeService(INodeService):
         node_tree = await self.get_tree(node_id)
         return node_tree
 
+    async def try_iter_tree(
+        self, initiator_id: UserId, node_id: NodeId
+    ) -> AsyncIterator[list[NodeExtendedSchema]]:
+        """
+        Try get subtree of a node level by level
+
+        Args:
+            initiator_id (str): user id
+            node_id (str): node id
+
+        Returns:
+            AsyncIterator[list[NodeExtendedSchema]]: levels of a subtree, starting \
+                with the node itself, the iterator raises NodeNotFoundError \
+                and stops if some subnode is removed while being read
+
+        Raises:
+            UserNotFoundError: raises when user with given id does not exist
+            NotAllowedError: raised when user tries to get nodes from project \
+                they do not own
+            NodeNotFoundError: raised when node with given id does not exist
+        """
+        await self.__user_service.user_exist_validation(initiator_id)
+        await self.__check_initiator_permission(initiator_id, node_id)
+        return await self.iter_tree(node_id)
+
     async def try_delete(self, initiator_id: UserId, node_id: NodeId) -> None:
         """
         try delete
@@ -167,8 +197,6 @@ class NodeService(INodeService):
             NotAllowedError: raised when user tries to update node from project \
             they do not own
             NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
         """
         await self.__user_service.user_exist_validation(initiator_id)
         await self.__check_initiator_permission(initiator_id, node_id)
@@ -197,21 +225,23 @@ class NodeService(INodeService):
                 do not own
             NodeNotFoundError: raised when there is no node with id provided \
                 by new_node
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
         """
         await self.__user_service.user_exist_validation(initiator_id)
         await self.__check_initiator_permission(initiator_id, new_node.parent)
-        parent_attributes = await self.__attribute_service.get_attribute(
-            new_node.parent
-        )
+        try:
+            parent_attributes = await self.__attribute_service.get_attribute(
+                new_node.parent
+            )
+        except NodeAttributeNotFoundError:
+            # the permission check may pass on a cached root of a node
+            # deleted by another instance
+            raise NodeNotFoundError()
         parent_type = await self.__attribute_service.get_type(parent_attributes.type_id)
         if not parent_type.holder:
             raise EndNodeError()
         instantiated_tree = await self.__template_service.instantiate(
-            new_node.template_id
+            new_node.template_id, new_node.parent
         )
-        await self.__reparent(instantiated_tree.id, new_node.parent)
         # TODO: return NodeTreeSchema
         return instantiated_tree.id
 
@@ -220,15 +250,78 @@ class NodeService(INodeService):
     ) -> NodeId:
         # TODO: docstring
         new_node = NodeSchema(parent=parent_id)
-        self.__registry.create(new_node.id, new_node.model_dump(exclude={"id"}))
+        if parent_id is None:
+            new_node.root_id = new_node.id
+        else:
+            new_node.root_id = await self.__get_root_node_id(parent_id)
+        self.__registry.create(new_node.id, new_node.dump_without_id())
         await self.__attribute_service.create_attribute(new_node.id, node_attributes)
 
         if parent_id is not None:
-            parent = await self.__get(parent_id)
-            parent.children.append(new_node.id)
-            self.__registry.update(parent.id, parent.model_dump(exclude={"id"}))
+            parent_children = await self.__get_children(parent_id)
+            parent_children.append(new_node.id)
+            self.__registry.update(parent_id, {"children": parent_children})
+        self.__root_node_ids.set(new_node.id, new_node.root_id)
         return new_node.id
 
+    async def create_bulk(
+        self,
+        nodes: list[tuple[int | None, NodeAttributeExternalSchema]],
+        parent_id: NodeId | None = None,
+    ) -> list[NodeId]:
+        """
+        Create several new nodes at once, linking them to each other
+
+        Args:
+            nodes (list[tuple[int | None, NodeAttributeExternalSchema]]): parent \
+                and attributes of every new node, parent is given as index of \
+                a node listed earlier or None for a top level node
+            parent_id (str | None): id of existing node to attach top level nodes \
+                to, they become root nodes if None
+
+        Returns:
+            list[str]: ids of new nodes in the same order
+
+        Raises:
+            IndexError: raised when parent index does not point to a node \
+                listed earlier
+            NodeNotFoundError: raised when node with parent_id does not exist
+        """
+        parent_children: list[NodeId] = []
+        parent_root_node_id: NodeId | None = None
+        if parent_id is not None:
+            parent_children = await self.__get_children(parent_id)
+            parent_root_node_id = await self.__get_root_node_id(parent_id)
+        new_nodes: list[NodeSchema] = []
+        for parent_index, _ in nodes:
+            new_node = NodeSchema(parent=parent_id)
+            new_node.root_id = parent_root_node_id or new_node.id
+            if parent_index is not None:
+                if not 0 <= parent_index < len(new_nodes):
+                    raise IndexError()
+                parent = new_nodes[parent_index]
+                new_node.parent = parent.id
+                new_node.root_id = parent.root_id
+                parent.children.append(new_node.id)
+            elif parent_id is not None:
+                parent_children.append(new_node.id)
+            new_nodes.append(new_node)
+        # attributes are validated on write, so no node is stored for invalid ones
+        await self.__attribute_service.create_attributes_bulk(
+            {
+                new_node.id: node_attributes
+                for new_node, (_, node_attributes) in zip(new_nodes, nodes)
+            }
+        )
+        self.__registry.create_many(
+            {new_node.id: new_node.dump_without_id() for new_node in new_nodes}
+        )
+        if parent_id is not None:
+            self.__registry.update(parent_id, {"children": parent_children})
+        for new_node in new_nodes:
+            self.__root_node_ids.set(new_node.id, cast(NodeId, new_node.root_id))
+        return [new_node.id for new_node in new_nodes]
+
     async def exist(self, node_id: NodeId) -> bool:
         """
         check if node exist
@@ -239,8 +332,7 @@ class NodeService(INodeService):
         Returns:
             bool: bool result depicting existence of a node
         """
-        node = self.__registry.get(node_id)
-        return node is not None
+        return self.__registry.exists(node_id)
 
     async def get_tree(self, node_id: NodeId) -> NodeTreeSchema:
         """
@@ -255,37 +347,111 @@ class NodeService(INodeService):
         Raises:
             NodeNotFoundError: raised when node with given id does not exist
         """
-        attributes = await self.__attribute_service.get_attribute(node_id)
-        attribute_type = await self.__attribute_service.get_type(attributes.type_id)
-        tree_root = NodeTreeSchema(
-            id=node_id,
-            type_id=attributes.type_id,
-            attrs=attributes.attrs,
-            holder=attribute_type.holder,
-            children=[],
+        subtree = {node.id: node for node in await self.__get_subtree(node_id)}
+        if node_id not in subtree:
+            raise NodeNotFoundError()
+        attributes = await self.__attribute_service.get_attributes_bulk(list(subtree))
+        attribute_types = await self.__attribute_service.get_types_bulk(
+            list({attribute.type_id for attribute in attributes.values()})
         )
-        nodes_to_process = [tree_root]
-        while len(nodes_to_process) > 0:
-            current_tree_node = nodes_to_process.pop()
-            current_node = await self.__get(current_tree_node.id)
-            for child_node_id in current_node.children:
-                child_attributes = await self.__attribute_service.get_attribute(
-                    child_node_id
-                )
-                child_attribute_type = await self.__attribute_service.get_type(
-                    child_attributes.type_id
-                )
-                current_tree_node.children.append(
-                    NodeTreeSchema(
-                        id=child_node_id,
-                        type_id=child_attributes.type_id,
-                        attrs=child_attributes.attrs,
-                        holder=child_attribute_type.holder,
-                        children=[],
-                    )
+        tree_nodes = {
+            id: NodeTreeSchema.model_construct(
+                id=id,
+                type_id=attribute.type_id,
+                attrs=attribute.attrs,
+                holder=attribute_types[attribute.type_id].holder,
+                children=[],
+            )
+            for id, attribute in attributes.items()
+        }
+        for node in subtree.values():
+            for child_node_id in node.children:
+                if child_node_id not in tree_nodes:
+                    raise NodeNotFoundError()
+                tree_nodes[node.id].children.append(tree_nodes[child_node_id])
+        return tree_nodes[node_id]
+
+    async def iter_tree(
+        self, node_id: NodeId
+    ) -> AsyncIterator[list[NodeExtendedSchema]]:
+        """
+        Get node and subnodes level by level, the node itself is fetched right away \
+        and every next level only when the previous one has been consumed
+
+        Args:
+            node_id (str): id of a node
+
+        Returns:
+            AsyncIterator[list[NodeExtendedSchema]]: nodes of every tree level, \
+                ordered as their parents list them, the iterator raises \
+                NodeNotFoundError and stops if some subnode does not exist
+
+        Raises:
+            NodeNotFoundError: raised when node with given id does not exist
+        """
+        root_level = await self.__get_tree_level([node_id])
+        return self.__iter_tree_levels(root_level)
+
+    async def __iter_tree_levels(
+        self, level: list[NodeExtendedSchema]
+    ) -> AsyncIterator[list[NodeExtendedSchema]]:
+        """
+        yield given tree level and all levels below it
+
+        Args:
+            level (list[NodeExtendedSchema]): first level to yield
+
+        Returns:
+            AsyncIterator[list[NodeExtendedSchema]]: nodes of every tree level
+
+        Raises:
+            NodeNotFoundError: raised when some node of a subtree does not exist
+        """
+        while len(level) > 0:
+            yield level
+            level = await self.__get_tree_level(
+                [child_node_id for node in level for child_node_id in node.children]
+            )
+
+    async def __get_tree_level(
+        self, node_ids: list[NodeId]
+    ) -> list[NodeExtendedSchema]:
+        """
+        get nodes of one tree level together with their attributes
+
+        Args:
+            node_ids (list[str]): ids of nodes
+
+        Returns:
+            list[NodeExtendedSchema]: nodes in the same order as node_ids
+
+        Raises:
+            NodeNotFoundError: raised when some node does not exist
+        """
+        if len(node_ids) == 0:
+            return []
+        nodes = self.__registry.batch_get(list(node_ids))
+        if len(nodes) != len(set(node_ids)):
+            raise NodeNotFoundError()
+        attributes = await self.__attribute_service.get_attributes_bulk(node_ids)
+        attribute_types = await self.__attribute_service.get_types_bulk(
+            list({attribute.type_id for attribute in attributes.values()})
+        )
+        level = []
+        for node_id in node_ids:
+            node = self.__to_schema(nodes[node_id])
+            attribute = attributes[node_id]
+            level.append(
+                NodeExtendedSchema.model_construct(
+                    parent=node.parent,
+                    id=node.id,
+                    children=node.children,
+                    type_id=attribute.type_id,
+                    attrs=attribute.attrs,
+                    holder=attribute_types[attribute.type_id].holder,
                 )
-            nodes_to_process.extend(current_tree_node.children)
-        return tree_root
+            )
+        return level
 
     async def __get(self, node_id: NodeId) -> NodeSchema:
         """
@@ -300,10 +466,77 @@ class NodeService(INodeService):
         Returns:
             NodeSchema: dict representation of node
         """
+        node = await self.__get_raw(node_id)
+        return self.__to_schema(node)
+
+    def __to_schema(self, node: RegistryData) -> NodeSchema:
+        """
+        build NodeSchema from registry record without validation, records are \
+        written by this service only and are trusted
+
+        Args:
+            node (RegistryData): registry record of node
+
+        Returns:
+            NodeSchema: dict representation of node
+        """
+        return NodeSchema.model_construct(**cast(dict[str, Any], node))
+
+    async def __get_raw(self, node_id: NodeId) -> RegistryData:
+        """
+        get node record from database as is, without building NodeSchema
+
+        Args:
+            node_id (str): node id
+
+        Raises:
+            NodeNotFoundError: raised when node with given id does not exist
+
+        Returns:
+            RegistryData: registry record of node
+        """
         node = self.__registry.get(node_id)
         if node is None:
             raise NodeNotFoundError()
-        return NodeSchema(**node)
+        return node
+
+    async def __get_children(self, node_id: NodeId) -> list[NodeId]:
+        """
+        get ids of node children, the list can be mutated and written back
+
+        Args:
+            node_id (str): node id
+
+        Raises:
+            NodeNotFoundError: raised when node with given id does not exist
+
+        Returns:
+            list[str]: ids of node children
+        """
+        node = await self.__get_raw(node_id)
+        return cast(list[NodeId], node["children"])
+
+    async def __get_subtree(self, node_id: NodeId) -> list[NodeSchema]:
+        """
+        get node and all its subnodes, fetching one tree level per request
+
+        Args:
+            node_id (str): id of a subtree root
+
+        Returns:
+            list[NodeSchema]: dict representations of nodes in no particular \
+                order, nodes missing in database are skipped
+        """
+        subtree = []
+        nodes_to_process: list[str] = [node_id]
+        while len(nodes_to_process) > 0:
+            nodes = self.__registry.batch_get(nodes_to_process)
+            nodes_to_process = []
+            for node_data in nodes.values():
+                node = self.__to_schema(node_data)
+                subtree.append(node)
+                nodes_to_process.extend(node.children)
+        return subtree
 
     async def __get_extended(self, node_id: NodeId) -> NodeExtendedSchema:
         node = await self.__get(node_id)
@@ -328,10 +561,27 @@ class NodeService(INodeService):
         Raises:
             NodeNotFoundError: raised when node with given id does not exist
         """
-        node = await self.__get(node_id)
-        while node.parent is not None:
-            node = await self.__get(node.parent)
-        return node.id
+        visited_node_ids = []
+        current_node_id = node_id
+        root_node_id = self.__root_node_ids.get(current_node_id)
+        while root_node_id is None:
+            node = self.__registry.get_projection(
+                current_node_id, {"parent", "root_id"}
+            )
+            if node is None:
+                raise NodeNotFoundError()
+            visited_node_ids.append(current_node_id)
+            if node.get("root_id") is not None:
+                root_node_id = cast(NodeId, node["root_id"])
+            elif node.get("parent") is None:
+                root_node_id = current_node_id
+            else:
+                # node was stored before root ids were, walk up to the root
+                current_node_id = cast(NodeId, node["parent"])
+                root_node_id = self.__root_node_ids.get(current_node_id)
+        for visited_node_id in visited_node_ids:
+            self.__root_node_ids.set(visited_node_id, root_node_id)
+        return root_node_id
 
     async def delete(self, node_id: NodeId) -> None:
         """
@@ -345,24 +595,21 @@ class NodeService(INodeService):
         """
         node = await self.__get(node_id)
         if node.parent is not None:
-            parent = await self.__get(node.parent)
-            parent.children.remove(node_id)
-            self.__registry.update(parent.id, parent.model_dump(exclude={"id"}))
-
-        children = [node_id]
-        while len(children) > 0:
-            node_id = children.pop()
-            try:
-                node = await self.__get(node_id)
-            except NodeNotFoundError:
-                continue
-            children.extend(node.children)
-            self.__registry.delete(node_id)
-            await self.__attribute_service.delete_attribute(node_id)
+            parent_children = await self.__get_children(node.parent)
+            parent_children.remove(node_id)
+            self.__registry.update(node.parent, {"children": parent_children})
+
+        node_ids_to_delete = [node.id for node in await self.__get_subtree(node_id)]
+        for node_id_to_delete in node_ids_to_delete:
+            self.__root_node_ids.pop(node_id_to_delete)
+            self.__owner_ids.pop(node_id_to_delete)
+        self.__registry.delete_many(list(node_ids_to_delete))
+        await self.__attribute_service.delete_attributes_bulk(node_ids_to_delete)
 
     async def __reparent(self, node_id: NodeId, new_parent_id: NodeId) -> None:
         """
-        change parent of node with new_parent_id
+        change parent of node with new_parent_id, both must be in the same tree \
+        as root ids stored on the moved subtree are kept
 
         Args:
             node_id (str): node to change parent id
@@ -372,17 +619,18 @@ class NodeService(INodeService):
             NodeNotFoundError: raised when node with given id does not exist
         """
         node = await self.__get(node_id)
-        parent = await self.__get(new_parent_id)
+        if node.parent == new_parent_id:
+            return
+        parent_children = await self.__get_children(new_parent_id)
         if node.parent is not None:
-            old_parent = await self.__get(node.parent)
-            old_parent.children.remove(node.id)
-            self.__registry.update(old_parent.id, old_parent.model_dump(exclude={"id"}))
+            old_parent_children = await self.__get_children(node.parent)
+            old_parent_children.remove(node.id)
+            self.__registry.update(node.parent, {"children": old_parent_children})
 
-        parent.children.append(node.id)
-        node.parent = parent.id
+        parent_children.append(node.id)
 
-        self.__registry.update(node.id, node.model_dump(exclude={"id"}))
-        self.__registry.update(parent.id, parent.model_dump(exclude={"id"}))
+        self.__registry.update(node.id, {"parent": new_parent_id})
+        self.__registry.update(new_parent_id, {"children": parent_children})
 
     async def __check_initiator_permission(
         self, initiator_id: UserId, node_id: NodeId
@@ -395,24 +643,28 @@ class NodeService(INodeService):
             node_id (str): id of node which will be used
 
         Raises:
-            NotAllowedError: raised when initiator can't performe actions with node
+            NotAllowedError: raised when initiator can't performe actions with node \
+                or node does not belong to any project
             NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
         """
         root_node_id = await self.__get_root_node_id(node_id)
-        project = await self.__project_service.get_by_root_node_id(root_node_id)
-        if project.owner_id != initiator_id:
+        if self.__owner_ids.get(root_node_id) == initiator_id:
+            return
+        if not await self.__project_service.is_owner(root_node_id, initiator_id):
             raise NotAllowedError()
+        self.__owner_ids.set(root_node_id, initiator_id)
 
     async def __change_position(self, node_id: NodeId, new_position: int) -> None:
         node = await self.__get(node_id)
         if node.parent is None:
             raise IncompatibleNodeError
-        parent_node = await self.__get(node.parent)
-        parent_node.children.remove(node.id)
-        parent_node.children.insert(new_position, node.id)
-        self.__registry.update(parent_node.id, {"children": parent_node.children})
+        parent_children = await self.__get_children(node.parent)
+        position = parent_children.index(node.id)
+        if position == new_position:
+            return
+        parent_children.pop(position)
+        parent_children.insert(new_position, node.id)
+        self.__registry.update(node.parent, {"children": parent_children})
 
     async def __in_same_tree(self, *node_ids: NodeId) -> bool:
         """
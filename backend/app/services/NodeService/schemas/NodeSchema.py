@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -9,3 +10,14 @@ class NodeSchema(BaseModel):
     parent: NodeId | None
     id: NodeId = Field(default_factory=lambda: NodeId(str(uuid4())))
     children: list[NodeId] = []
+    root_id: NodeId | None = Field(default=None, exclude=True)
+
+    def dump_without_id(self) -> dict[str, Any]:
+        """
+        Registry record of node, id is the registry key and is not stored in it
+        """
+        return {
+            "parent": self.parent,
+            "children": list(self.children),
+            "root_id": self.root_id,
+        }
@@ -45,5 +45,5 @@ class IProjectService(ABC):
         pass
 
     @abstractmethod
-    async def get_by_root_node_id(self, node_id: NodeId) -> ProjectSchema:
+    async def is_owner(self, node_id: NodeId, user_id: UserId) -> bool:
         pass
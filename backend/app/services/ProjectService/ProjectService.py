@@ -221,28 +221,20 @@ class ProjectService(IProjectService):
             raise NotAllowedError()
         return project_schema
 
-    async def get_by_root_node_id(self, node_id: NodeId) -> ProjectSchema:
+    async def is_owner(self, node_id: NodeId, user_id: UserId) -> bool:
         """
-        get project using it's root node
+        check if user owns the project with given root node, without fetching \
+            the project itself
 
         Args:
             node_id (str): id of a root node
+            user_id (str): id of a user
 
         Returns:
-            ProjectSchema: dict representation of a project
-
-        Raises:
-            NodeNotFoundError: raised when node with given id does not exist
-            ProjectNotFoundError: raised when there is no project that has given node \
-                as a root node
+            bool: True if there is a project with given root node owned by user, \
+                False otherwise
         """
-        if not await self.__node_service.exist(node_id):
-            raise NodeNotFoundError()
-        project = self.__registry.read({"core_node_id": node_id})
-        if len(project) < 1:
-            raise ProjectNotFoundError()
-        project_schema = ProjectSchema(**project[0])
-        return project_schema
+        return self.__registry.count({"core_node_id": node_id, "owner_id": user_id}) > 0
 
     async def __delete(self, project_id: ProjectId) -> None:
         """
@@ -8,7 +8,9 @@ from .schemas.TemplateView import TemplateView
 
 class ITemplateService(ABC):
     @abstractmethod
-    async def instantiate(self, template_id: TemplateId) -> NodeTreeSchema:
+    async def instantiate(
+        self, template_id: TemplateId, parent_id: NodeId | None = None
+    ) -> NodeTreeSchema:
         pass
 
     @abstractmethod
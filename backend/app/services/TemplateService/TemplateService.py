@@ -41,7 +41,10 @@ class TemplateService(ITemplateService):
         Returns:
             list[TemplateId]: list of template ID
         """
-        return [TemplateSchema(**template).id for template in self.__registry.read({})]
+        return [
+            TemplateId(str(template["id"]))
+            for template in self.__registry.read_projection({}, {"id"})
+        ]
 
     async def get(self, template_id: TemplateId) -> TemplateView:
         """
@@ -56,12 +59,9 @@ class TemplateService(ITemplateService):
         Returns:
             TemplateView: An object representation of a template
         """
-        result = self.__registry.get(template_id)
-        if result is None:
-            raise TemplateDoesNotExistError()
-        template = TemplateSchema(**result)
-        tree = await self.__node_service.get_tree(template.root_node_id)
-        return TemplateView(id=template.id, tree=tree)
+        root_node_id = await self.__get_root_node_id(template_id)
+        tree = await self.__node_service.get_tree(root_node_id)
+        return TemplateView(id=template_id, tree=tree)
 
     async def create(self, node_id: NodeId) -> TemplateId:
         """
@@ -80,56 +80,89 @@ class TemplateService(ITemplateService):
         return template.id
 
     async def delete(self, template_id: TemplateId) -> None:
-        template = await self.get(template_id)
-        await self.__node_service.delete(template.tree.id)
+        root_node_id = await self.__get_root_node_id(template_id)
+        await self.__node_service.delete(root_node_id)
         self.__registry.delete(template_id)
 
-    async def instantiate(self, template_id: TemplateId) -> NodeTreeSchema:
+    async def instantiate(
+        self, template_id: TemplateId, parent_id: NodeId | None = None
+    ) -> NodeTreeSchema:
         """
         Instantiate a template
 
         Args:
             template_id (TemplateId): ID of a template to be instantiated
+            parent_id (NodeId | None): ID of a node the copy is attached to, \
+                the copy is a separate tree if None
 
         Returns:
             NodeTreeSchema: instantiated (copied) template
         """
         root_node_id = await self.__get_root_node_id(template_id)
         tree = await self.__node_service.get_tree(root_node_id)
-        copied_tree = await self.__deep_copy(tree)
+        copied_tree = await self.__deep_copy(tree, parent_id)
         return copied_tree
 
-    async def __deep_copy(self, tree: NodeTreeSchema) -> NodeTreeSchema:
+    async def __deep_copy(
+        self, tree: NodeTreeSchema, parent_id: NodeId | None = None
+    ) -> NodeTreeSchema:
         """
         Copy template and his progeny as a regular nodes
 
         Args:
             tree (NodeTreeSchema): Original template and his progeny
+            parent_id (NodeId | None): ID of a node the copy is attached to
 
         Returns:
             NodeTreeSchema: copied NodeTree
         """
-        copied_tree = tree.model_copy(deep=True)
-        root_id = await self.__node_service.create(
-            parent_id=None,
-            node_attributes=NodeAttributeExternalSchema(
-                type_id=copied_tree.type_id,
-                attrs=copied_tree.attrs,
-            ),
-        )
-        copied_tree.id = root_id
-        stack = [(root_id, child) for child in copied_tree.children]
-        while len(stack) > 0:
-            parent_id, current = stack.pop()
-            current.id = await self.__node_service.create(
-                parent_id,
+        copied_tree = self.__copy_tree(tree)
+        copied_nodes = [copied_tree]
+        new_nodes: list[tuple[int | None, NodeAttributeExternalSchema]] = [
+            (
+                None,
                 NodeAttributeExternalSchema(
-                    type_id=current.type_id, attrs=current.attrs
+                    type_id=copied_tree.type_id, attrs=copied_tree.attrs
                 ),
             )
-            stack.extend([(current.id, child) for child in current.children])
+        ]
+        # copied_nodes grows while being walked, so nodes are listed breadth-first
+        # and every parent is listed before its children
+        for parent_index, current in enumerate(copied_nodes):
+            for child in current.children:
+                copied_nodes.append(child)
+                new_nodes.append(
+                    (
+                        parent_index,
+                        NodeAttributeExternalSchema(
+                            type_id=child.type_id, attrs=child.attrs
+                        ),
+                    )
+                )
+        new_ids = await self.__node_service.create_bulk(new_nodes, parent_id)
+        for current, new_id in zip(copied_nodes, new_ids):
+            current.id = new_id
         return copied_tree
 
+    def __copy_tree(self, tree: NodeTreeSchema) -> NodeTreeSchema:
+        """
+        Copy tree structure without validating it again, attribute values are \
+        strings so only the attrs dicts are copied
+
+        Args:
+            tree (NodeTreeSchema): tree to be copied
+
+        Returns:
+            NodeTreeSchema: copied tree
+        """
+        return NodeTreeSchema.model_construct(
+            id=tree.id,
+            type_id=tree.type_id,
+            attrs=dict(tree.attrs),
+            holder=tree.holder,
+            children=[self.__copy_tree(child) for child in tree.children],
+        )
+
     async def __get_root_node_id(self, templte_id: TemplateId) -> NodeId:
         """
         Get template's root node id
@@ -143,11 +176,10 @@ class TemplateService(ITemplateService):
         Returns:
             NodeId: ID of a root node
         """
-        result = self.__registry.get(templte_id)
+        result = self.__registry.get_projection(templte_id, {"root_node_id"})
         if result is None:
             raise TemplateDoesNotExistError()
-        template = TemplateSchema(**result)
-        return template.root_node_id
+        return NodeId(str(result["root_node_id"]))
 
     async def __prepopulate(self) -> None:
         """
@@ -95,8 +95,7 @@ class UserService(IUserService):
         Returns:
             bool: True if the user exists, False otherwise.
         """
-        result = self.__registry.get(user_id)
-        return result is not None
+        return self.__registry.exists(user_id)
 
     async def __get_by_id(self, user_id: UserId) -> UserSchema:
         """
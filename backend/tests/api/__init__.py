@@ -1,6 +1,9 @@
+from .images import ApiImages
+from .nodes import ApiNodes
 from .projects import ApiProjects
+from .templates import ApiTemplates
 from .users import ApiUsers
 
 
-class ClientApi(ApiUsers, ApiProjects):
+class ClientApi(ApiUsers, ApiProjects, ApiNodes, ApiTemplates, ApiImages):
     pass
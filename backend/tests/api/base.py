@@ -15,10 +15,16 @@ class ApiBase:
 
     USERS = API_V1 + "/users"
     PROJECTS = API_V1 + "/projects"
+    NODES = API_V1 + "/nodes"
+    TEMPLATES = API_V1 + "/templates"
+    IMAGES = API_V1 + "/images"
 
     USER = USERS + "/{user_id}"
     PROJECT = PROJECTS + "/{project_id}"
     PROJECT_BY_USER = PROJECTS + "/by/user/{user_id}"
+    NODE = NODES + "/{node_id}"
+    NODE_TREE_LEVELS = NODES + "/tree/{node_id}/levels"
+    TEMPLATE = TEMPLATES + "/{template_id}"
 
     def __init__(self, app: FastAPI):
         self.client = TestClient(app)
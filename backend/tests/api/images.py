@@ -0,0 +1,41 @@
+import httpx
+
+from .base import ApiBase
+
+
+class ApiImages(ApiBase):
+    """
+    Class representing an API client for interacting with the `/images` \
+    endpoints group.
+
+    Inherits from `ApiBase` to provide common API interaction functionalities.
+    """
+
+    def add_image(
+        self,
+        node_id: str,
+        file_name: str,
+        content: bytes,
+        content_type: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Uploads an image for a node on the `/images` endpoint.
+
+        Args:
+            node_id (str): The unique identifier of the node.
+            file_name (str): The name of the uploaded file.
+            content (bytes): The file content.
+            content_type (str): The MIME type of the file.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object.
+        """
+
+        url = self.IMAGES + "/"
+        data = {"node_id": node_id}
+        files = {"file": (file_name, content, content_type)}
+        headers = {"user-init-data": user_init_data}
+
+        return self.client.post(url=url, data=data, files=files, headers=headers)
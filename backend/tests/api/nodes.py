@@ -0,0 +1,126 @@
+import httpx
+
+from .base import ApiBase
+
+
+class ApiNodes(ApiBase):
+    """
+    Class representing an API client for interacting with the `/nodes` endpoints group.
+
+    Inherits from `ApiBase` to provide common API interaction functionalities.
+    """
+
+    def create_node(
+        self,
+        parent_id: str,
+        template_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Creates a new node from a template on the `/nodes` endpoint.
+
+        Args:
+            parent_id (str): The unique identifier of the parent node.
+            template_id (str): The unique identifier of the template to instantiate.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object containing the new node id.
+        """
+
+        url = self.NODES + "/"
+        json = {"parent": parent_id, "template_id": template_id}
+        headers = {"user-init-data": user_init_data}
+
+        return self.post(url=url, json=json, headers=headers)
+
+    def get_node(
+        self,
+        node_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Retrieves a specific node from the API.
+
+        Args:
+            node_id (str): The unique identifier of the node to retrieve.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object from the API containing node \
+                information.
+        """
+
+        url = self.NODE.format(node_id=node_id)
+        headers = {"user-init-data": user_init_data}
+
+        return self.get(url=url, headers=headers)
+
+    def update_node(
+        self,
+        node_id: str,
+        parent_id: str,
+        position: int,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Moves a node to a new parent and position on the API.
+
+        Args:
+            node_id (str): The unique identifier of the node to move.
+            parent_id (str): The unique identifier of the new parent node.
+            position (int): The new position among the parent's children.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object.
+        """
+
+        url = self.NODE.format(node_id=node_id)
+        json = {"parent": parent_id, "position": position}
+        headers = {"user-init-data": user_init_data}
+
+        return self.patch(url=url, json=json, headers=headers)
+
+    def delete_node(
+        self,
+        node_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Deletes a node together with its subnodes on the API.
+
+        Args:
+            node_id (str): The unique identifier of the node to delete.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object.
+        """
+
+        url = self.NODE.format(node_id=node_id)
+        headers = {"user-init-data": user_init_data}
+
+        return self.delete(url=url, headers=headers)
+
+    def get_node_tree_levels(
+        self,
+        node_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Retrieves a node and its subnodes level by level from the API.
+
+        Args:
+            node_id (str): The unique identifier of the subtree root.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object from the API containing one JSON \
+                array of nodes per line.
+        """
+
+        url = self.NODE_TREE_LEVELS.format(node_id=node_id)
+        headers = {"user-init-data": user_init_data}
+
+        return self.get(url=url, headers=headers)
@@ -0,0 +1,76 @@
+import httpx
+
+from .base import ApiBase
+
+
+class ApiTemplates(ApiBase):
+    """
+    Class representing an API client for interacting with the `/templates` \
+    endpoints group.
+
+    Inherits from `ApiBase` to provide common API interaction functionalities.
+    """
+
+    def get_templates(
+        self,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Retrieves ids of all templates from the API.
+
+        Args:
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object from the API containing a list \
+                of template ids.
+        """
+
+        url = self.TEMPLATES + "/"
+        headers = {"user-init-data": user_init_data}
+
+        return self.get(url=url, headers=headers)
+
+    def get_template(
+        self,
+        template_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Retrieves a specific template from the API.
+
+        Args:
+            template_id (str): The unique identifier of the template to retrieve.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object from the API containing template \
+                tree.
+        """
+
+        url = self.TEMPLATE.format(template_id=template_id)
+        headers = {"user-init-data": user_init_data}
+
+        return self.get(url=url, headers=headers)
+
+    def create_template(
+        self,
+        node_id: str,
+        user_init_data: str,
+    ) -> httpx.Response:
+        """
+        Creates a new template from a node and its subnodes on the API.
+
+        Args:
+            node_id (str): The unique identifier of the node to copy.
+            user_init_data (str): User-specific initialization data required by the API.
+
+        Returns:
+            httpx.Response: The response object containing the new template id.
+        """
+
+        url = self.TEMPLATES + "/"
+        params = {"node_id": node_id}
+        headers = {"user-init-data": user_init_data}
+
+        return self.client.post(url=url, params=params, headers=headers)
@@ -54,3 +54,33 @@ def create_project() -> Callable[[str], Project]:
         return project
 
     return _create_project
+
+
+@pytest.fixture
+def create_node() -> Callable[[str, str, str], str]:
+    def _create_node(parent_id: str, type_id: str, user_init_data: str) -> str:
+        response = client.get_templates(user_init_data=user_init_data)
+        assert response.status_code == status.HTTP_200_OK
+
+        for template_id in response.json():
+            template = client.get_template(
+                template_id=template_id,
+                user_init_data=user_init_data,
+            ).json()
+            tree = template["tree"]
+            if tree["type_id"] == type_id and not tree["children"]:
+                break
+        else:
+            raise ValueError(f"There is no template of type {type_id}")
+
+        response = client.create_node(
+            parent_id=parent_id,
+            template_id=template_id,
+            user_init_data=user_init_data,
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        return response.json()
+
+    return _create_node
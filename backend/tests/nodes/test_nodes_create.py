@@ -0,0 +1,212 @@
+import json
+from typing import Callable
+
+from fastapi import status
+
+from ..setup import client
+
+"""
+### POST /nodes/
+
+user-init-data:
+
+1. пользователь существует
+2. пользователь не существует
+3. неправильный формат
+
+parent:
+
+1. контейнер в проекте инициатора
+2. текст в проекте инициатора
+3. существует и не принадлежит проекту инициатора
+4. не существует
+
+template_id:
+
+1. шаблон из нескольких вложенных узлов
+2. не существует
+
+- (1, 1, 1) - 201 - копия повторяет шаблон, порядок children сохранен
+- (1, 1, 2) - 404
+- (1, 2, 1) - 400
+- (1, 3, 1) - 403
+- (1, 4, 1) - 404
+- (3, 1, 1) - 401
+"""
+
+
+def get_tree_levels(node_id: str, user_init_data: str) -> list[list[dict]]:
+    response = client.get_node_tree_levels(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def create_template(
+    parent_id: str, create_node: Callable, user_init_data: str
+) -> tuple[str, str]:
+    """
+    Builds a container with text, container and image children, the inner \
+    container holding one more image, and saves it as a template keeping \
+    children order.
+
+    Returns:
+        tuple[str, str]: id of the template root node and id of the template
+    """
+    node_id = create_node(parent_id, "container", user_init_data)
+    create_node(node_id, "text", user_init_data)
+    container_id = create_node(node_id, "container", user_init_data)
+    create_node(container_id, "image", user_init_data)
+    create_node(node_id, "image", user_init_data)
+
+    response = client.create_template(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    template_id = response.json()
+
+    response = client.get_template(
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    children = response.json()["tree"]["children"]
+    assert [child["type_id"] for child in children] == ["text", "container", "image"]
+
+    return node_id, template_id
+
+
+# (1, 1, 1)
+def test_create_node(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 1, 1) - 201 - копия повторяет шаблон, порядок children сохранен"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id, template_id = create_template(
+        project.core_node_id, create_node, user_init_data
+    )
+
+    response = client.create_node(
+        parent_id=project.core_node_id,
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    copy_id = response.json()
+
+    original_levels = get_tree_levels(node_id, user_init_data)
+    copy_levels = get_tree_levels(copy_id, user_init_data)
+    assert [[node["type_id"] for node in level] for level in copy_levels] == [
+        ["container"],
+        ["text", "container", "image"],
+        ["image"],
+    ]
+    assert [[node["type_id"] for node in level] for level in original_levels] == [
+        [node["type_id"] for node in level] for level in copy_levels
+    ]
+    original_ids = {node["id"] for level in original_levels for node in level}
+    copy_ids = {node["id"] for level in copy_levels for node in level}
+    assert original_ids.isdisjoint(copy_ids)
+    assert copy_levels[0][0]["parent"] == project.core_node_id
+
+    core_node = get_tree_levels(project.core_node_id, user_init_data)[0][0]
+    assert core_node["children"] == [node_id, copy_id]
+
+
+# (1, 1, 2)
+def test_try_create_node_from_nonexistent_template(
+    create_user: Callable, create_project: Callable
+) -> None:
+    """(1, 1, 2) - 404"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+
+    response = client.create_node(
+        parent_id=project.core_node_id,
+        template_id="0",
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (1, 2, 1)
+def test_try_create_node_in_text(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 2, 1) - 400"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, template_id = create_template(project.core_node_id, create_node, user_init_data)
+    text_id = create_node(project.core_node_id, "text", user_init_data)
+
+    response = client.create_node(
+        parent_id=text_id,
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# (1, 3, 1)
+def test_try_create_node_in_another_project(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 3, 1) - 403"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, template_id = create_template(project.core_node_id, create_node, user_init_data)
+    _, user_init_data = create_user()
+
+    response = client.create_node(
+        parent_id=project.core_node_id,
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# (1, 4, 1)
+def test_try_create_node_in_nonexistent_parent(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 4, 1) - 404"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, template_id = create_template(project.core_node_id, create_node, user_init_data)
+
+    response = client.create_node(
+        parent_id="0",
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (3, 1, 1)
+def test_try_create_node_with_bad_token(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(3, 1, 1) - 401"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, template_id = create_template(project.core_node_id, create_node, user_init_data)
+    user_init_data = "bad-format"
+
+    response = client.create_node(
+        parent_id=project.core_node_id,
+        template_id=template_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
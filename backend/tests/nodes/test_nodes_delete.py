@@ -0,0 +1,148 @@
+from os import path
+from typing import Callable
+
+from fastapi import status
+
+from app.config import settings
+
+from ..setup import client
+
+"""
+### DELETE /nodes/{node_id}
+
+user-init-data:
+
+1. пользователь существует
+2. пользователь не существует
+3. неправильный формат
+
+node_id:
+
+1. существует, принадлежит проекту инициатора и имеет вложенные узлы
+2. корень проекта инициатора
+3. существует и не принадлежит проекту инициатора
+4. не существует
+
+- (1, 1) - 200 - поддерево и его картинки удалились, children родителя обновлен
+- (1, 2) - 400
+- (1, 3) - 403
+- (1, 4) - 404
+- (3, 1) - 401
+"""
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(32)
+
+
+# (1, 1)
+def test_delete_node(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 1) - 200 - поддерево и его картинки удалились, children родителя обновлен"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "container", user_init_data)
+    sibling_id = create_node(project.core_node_id, "text", user_init_data)
+    text_id = create_node(node_id, "text", user_init_data)
+    container_id = create_node(node_id, "container", user_init_data)
+    leaf_id = create_node(container_id, "text", user_init_data)
+
+    response = client.add_image(
+        node_id=container_id,
+        file_name="background.png",
+        content=PNG,
+        content_type="image/png",
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert path.isfile(path.join(settings.storage, container_id))
+
+    response = client.delete_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not path.isfile(path.join(settings.storage, container_id))
+
+    for deleted_node_id in (node_id, text_id, container_id, leaf_id):
+        response = client.get_node(
+            node_id=deleted_node_id,
+            user_init_data=user_init_data,
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.get_node(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["children"] == [sibling_id]
+
+
+# (1, 2)
+def test_try_delete_project_root_node(
+    create_user: Callable, create_project: Callable
+) -> None:
+    """(1, 2) - 400"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+
+    response = client.delete_node(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+# (1, 3)
+def test_try_delete_node_of_another_project(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 3) - 403"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+    _, user_init_data = create_user()
+
+    response = client.delete_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# (1, 4)
+def test_try_delete_nonexistent_node(create_user: Callable) -> None:
+    """(1, 4) - 404"""
+    _, user_init_data = create_user()
+    node_id = "0"
+
+    response = client.delete_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (3, 1)
+def test_try_delete_node_with_bad_token(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(3, 1) - 401"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+    user_init_data = "bad-format"
+
+    response = client.delete_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
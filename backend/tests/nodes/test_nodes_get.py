@@ -0,0 +1,196 @@
+from typing import Callable
+
+from fastapi import status
+
+from ..setup import client
+
+"""
+### GET /nodes/{node_id}
+
+user-init-data:
+
+1. пользователь существует
+2. пользователь не существует
+3. неправильный формат
+
+node_id:
+
+1. скопирован из шаблона в проект инициатора
+2. вложен в копию шаблона в проекте инициатора
+3. перемещен внутри проекта инициатора
+4. существует и не принадлежит проекту инициатора
+5. принадлежал удаленному проекту инициатора
+6. не существует
+
+- (1, 1) - 200 - родитель узла - корень проекта
+- (1, 2) - 200 - доступ проверяется по корню проекта, другому пользователю - 403
+- (1, 3) - 200 - родитель узла изменился
+- (1, 4) - 403 - даже после обращения владельца
+- (1, 5) - 404 - даже после обращения владельца до удаления
+- (1, 6) - 404
+- (3, 1) - 401
+"""
+
+
+# (1, 1)
+def test_get_node(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 1) - 200 - родитель узла - корень проекта"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["parent"] == project.core_node_id
+
+
+# (1, 2)
+def test_get_nested_node(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 2) - 200 - доступ проверяется по корню проекта, другому пользователю - 403"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    container_id = create_node(project.core_node_id, "container", user_init_data)
+    node_id = create_node(container_id, "text", user_init_data)
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["parent"] == container_id
+
+    _, user_init_data = create_user()
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# (1, 3)
+def test_get_moved_node(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 3) - 200 - родитель узла изменился"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    container_id = create_node(project.core_node_id, "container", user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+
+    response = client.update_node(
+        node_id=node_id,
+        parent_id=container_id,
+        position=0,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["parent"] == container_id
+
+
+# (1, 4)
+def test_try_get_node_of_another_project(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 4) - 403 - даже после обращения владельца"""
+    _, owner_init_data = create_user()
+    project = create_project(user_init_data=owner_init_data)
+    node_id = create_node(project.core_node_id, "text", owner_init_data)
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=owner_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    _, user_init_data = create_user()
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# (1, 5)
+def test_try_get_node_of_deleted_project(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 5) - 404 - даже после обращения владельца до удаления"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    response = client.delete_project(
+        project_id=project.id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    for deleted_node_id in (node_id, project.core_node_id):
+        response = client.get_node(
+            node_id=deleted_node_id,
+            user_init_data=user_init_data,
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (1, 6)
+def test_try_get_nonexistent_node(create_user: Callable) -> None:
+    """(1, 6) - 404"""
+    _, user_init_data = create_user()
+    node_id = "0"
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (3, 1)
+def test_try_get_node_with_bad_token(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(3, 1) - 401"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    node_id = create_node(project.core_node_id, "text", user_init_data)
+    user_init_data = "bad-format"
+
+    response = client.get_node(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,122 @@
+import json
+from typing import Callable
+
+from fastapi import status
+
+from ..setup import client
+
+"""
+### GET /nodes/tree/{node_id}/levels
+
+user-init-data:
+
+1. пользователь существует
+2. пользователь не существует
+3. неправильный формат
+
+node_id:
+
+1. существует и принадлежит проекту инициатора
+2. существует и не принадлежит проекту инициатора
+3. не существует
+
+- (1, 1) - 200 - по строке на уровень, порядок узлов совпадает с children
+- (1, 2) - 403
+- (1, 3) - 404
+- (2, 1) - 401
+- (3, 1) - 401
+"""
+
+
+# (1, 1)
+def test_get_tree_levels(
+    create_user: Callable, create_project: Callable, create_node: Callable
+) -> None:
+    """(1, 1) - 200 - по строке на уровень, порядок узлов совпадает с children"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    container_id = create_node(project.core_node_id, "container", user_init_data)
+    text_id = create_node(project.core_node_id, "text", user_init_data)
+    first_leaf_id = create_node(container_id, "text", user_init_data)
+    second_leaf_id = create_node(container_id, "container", user_init_data)
+
+    response = client.get_node_tree_levels(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    levels = [json.loads(line) for line in response.text.splitlines()]
+    assert [[node["id"] for node in level] for level in levels] == [
+        [project.core_node_id],
+        [container_id, text_id],
+        [first_leaf_id, second_leaf_id],
+    ]
+    for level, next_level in zip(levels, levels[1:]):
+        children = [child for node in level for child in node["children"]]
+        assert [node["id"] for node in next_level] == children
+
+
+# (1, 2)
+def test_try_get_tree_levels_of_another_project(
+    create_user: Callable, create_project: Callable
+) -> None:
+    """(1, 2) - 403"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, user_init_data = create_user()
+
+    response = client.get_node_tree_levels(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+# (1, 3)
+def test_try_get_tree_levels_of_nonexistent_node(create_user: Callable) -> None:
+    """(1, 3) - 404"""
+    _, user_init_data = create_user()
+    node_id = "0"
+
+    response = client.get_node_tree_levels(
+        node_id=node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# (2, 1)
+def test_try_get_tree_levels_from_nonexistent_user(
+    create_user: Callable, create_project: Callable
+) -> None:
+    """(2, 1) - 401"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    _, user_init_data = client.get_random_user()
+
+    response = client.get_node_tree_levels(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+# (3, 1)
+def test_try_get_tree_levels_with_bad_token(
+    create_user: Callable, create_project: Callable
+) -> None:
+    """(3, 1) - 401"""
+    _, user_init_data = create_user()
+    project = create_project(user_init_data=user_init_data)
+    user_init_data = "bad-format"
+
+    response = client.get_node_tree_levels(
+        node_id=project.core_node_id,
+        user_init_data=user_init_data,
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,135 @@
+import time
+from typing import Any
+
+import pytest
+
+from app.registry.DynamoRegistry.DynamoRegistry import DynamoRegistry
+
+"""
+### DynamoRegistry
+
+batch_get:
+
+1. ключей больше, чем помещается в один запрос BatchGetItem
+2. часть ключей вернулась в UnprocessedKeys
+3. таблица не обрабатывает ключи ни с одной попытки
+
+count:
+
+1. результат сканирования разбит на несколько страниц
+
+- batch_get (1) - запросы не длиннее 100 ключей, повторы запрашиваются один раз
+- batch_get (2) - необработанные ключи запрашиваются повторно
+- batch_get (3) - TimeoutError после 5 попыток с растущими паузами
+- count (1) - складываются все страницы
+"""
+
+
+class FakeTable:
+    """
+    Table resource that serves scans page by page
+    """
+
+    name = "items"
+
+    def __init__(self, pages: list[int]) -> None:
+        self.pages = pages
+        self.scans: list[dict[str, Any]] = []
+
+    def scan(self, **kwargs: Any) -> dict[str, Any]:
+        self.scans.append(kwargs)
+        page = len(self.scans) - 1
+        response: dict[str, Any] = {"Count": self.pages[page]}
+        if page + 1 < len(self.pages):
+            response["LastEvaluatedKey"] = {"id": str(page)}
+        return response
+
+
+class FakeDynamoDB:
+    """
+    Service resource that leaves first `unprocessed` keys of a request \
+    unprocessed once, or on every request if `throttled`
+    """
+
+    def __init__(self, unprocessed: int = 0, throttled: bool = False) -> None:
+        self.unprocessed = unprocessed
+        self.throttled = throttled
+        self.requests: list[list[str]] = []
+
+    def batch_get_item(self, RequestItems: dict[str, Any]) -> dict[str, Any]:
+        keys = RequestItems[FakeTable.name]["Keys"]
+        ids = [key["id"] for key in keys]
+        self.requests.append(ids)
+        response: dict[str, Any] = {"Responses": {FakeTable.name: []}}
+        unprocessed = self.unprocessed
+        if not self.throttled:
+            self.unprocessed = 0
+        if unprocessed > 0:
+            response["UnprocessedKeys"] = {FakeTable.name: {"Keys": keys[:unprocessed]}}
+            keys = keys[unprocessed:]
+        response["Responses"][FakeTable.name] = [
+            {"id": key["id"], "value": key["id"]} for key in keys
+        ]
+        return response
+
+
+# batch_get (1)
+def test_batch_get_chunks() -> None:
+    """batch_get (1) - запросы не длиннее 100 ключей, повторы запрашиваются один раз"""
+    dynamodb = FakeDynamoDB()
+    registry = DynamoRegistry(dynamodb, FakeTable(pages=[]))
+    ids = [str(i) for i in range(250)]
+
+    items = registry.batch_get(ids + ids[:10])
+
+    assert [len(request) for request in dynamodb.requests] == [100, 100, 50]
+    assert sorted(items) == sorted(ids)
+    assert all(items[id]["value"] == id for id in ids)
+
+
+# batch_get (2)
+def test_batch_get_retries_unprocessed_keys() -> None:
+    """batch_get (2) - необработанные ключи запрашиваются повторно"""
+    dynamodb = FakeDynamoDB(unprocessed=3)
+    registry = DynamoRegistry(dynamodb, FakeTable(pages=[]))
+    ids = [str(i) for i in range(5)]
+
+    items = registry.batch_get(ids)
+
+    assert dynamodb.requests == [ids, ids[:3]]
+    assert sorted(items) == ids
+
+
+# batch_get (3)
+def test_batch_get_gives_up_on_throttled_table(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """batch_get (3) - TimeoutError после 5 попыток с растущими паузами"""
+    delays: list[float] = []
+    monkeypatch.setattr(time, "sleep", delays.append)
+    dynamodb = FakeDynamoDB(unprocessed=3, throttled=True)
+    registry = DynamoRegistry(dynamodb, FakeTable(pages=[]))
+    ids = [str(i) for i in range(5)]
+
+    with pytest.raises(TimeoutError):
+        registry.batch_get(ids)
+
+    assert dynamodb.requests == [ids] + [ids[:3]] * 4
+    assert delays == [0.05, 0.1, 0.2, 0.4]
+
+
+# count (1)
+def test_count_pages() -> None:
+    """count (1) - складываются все страницы"""
+    table = FakeTable(pages=[3, 0, 4])
+    registry = DynamoRegistry(FakeDynamoDB(), table)
+
+    count = registry.count({"owner_id": "1"})
+
+    assert count == 7
+    assert [scan.get("ExclusiveStartKey") for scan in table.scans] == [
+        None,
+        {"id": "0"},
+        {"id": "1"},
+    ]
+    assert all(scan["Select"] == "COUNT" for scan in table.scans)